@@ -37,11 +37,67 @@ def criar_tabelas():
         cursor.execute('''CREATE TABLE IF NOT EXISTS lembretes 
             (id SERIAL PRIMARY KEY, data_lembrete TEXT, mensagem TEXT)''')
         
+        # Depósitos (locais físicos onde o material fica guardado)
+        cursor.execute('''CREATE TABLE IF NOT EXISTS locais 
+            (id SERIAL PRIMARY KEY, nome TEXT UNIQUE)''')
+        
+        # Saldo de cada item em cada depósito. A chave primária (item, local) é o índice usado na Saída.
+        cursor.execute('''CREATE TABLE IF NOT EXISTS saldos 
+            (id_item INTEGER, id_local INTEGER, quantidade INTEGER CHECK (quantidade >= 0), PRIMARY KEY (id_item, id_local))''')
+        
+        cursor.execute('''CREATE TABLE IF NOT EXISTS transferencias 
+            (id SERIAL PRIMARY KEY, id_item INTEGER, id_origem INTEGER, id_destino INTEGER, quantidade INTEGER, data_transferencia TEXT)''')
+        
+        # Migração do modelo antigo (só existia a "Sede"), roda uma vez só: depois dela a coluna id_origem já existe
+        cursor.execute("SELECT 1 FROM information_schema.columns WHERE table_schema = current_schema() AND table_name = 'movimentacoes' AND column_name = 'id_origem'")
+        if cursor.fetchone() is None:
+            cursor.execute("ALTER TABLE movimentacoes ADD COLUMN id_origem INTEGER")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_movimentacoes_item ON movimentacoes (id_item)")
+            
+            # Tudo que não está em evento fica na Sede
+            cursor.execute("INSERT INTO locais (nome) VALUES ('Sede') ON CONFLICT (nome) DO NOTHING")
+            cursor.execute("UPDATE movimentacoes SET id_origem = (SELECT id FROM locais WHERE nome = 'Sede')")
+            cursor.execute('''SELECT i.id, i.quantidade - COALESCE(SUM(m.quantidade), 0)
+                FROM itens i LEFT JOIN movimentacoes m ON m.id_item = i.id
+                GROUP BY i.id, i.quantidade''')
+            sobras = cursor.fetchall()
+            cursor.execute("SELECT id FROM locais WHERE nome = 'Sede'")
+            id_sede = cursor.fetchone()[0]
+            # Itens com mais material em eventos do que o total cadastrado ficam sem saldo na Sede;
+            # o aviso de diferença no "📍 Onde está?" mostra esses casos até alguém corrigir
+            for id_item, qtd_sede in sobras:
+                if qtd_sede >= 0:
+                    cursor.execute("INSERT INTO saldos (id_item, id_local, quantidade) VALUES (%s, %s, %s)", (id_item, id_sede, qtd_sede))
+        
         con.commit()
         con.close()
     except Exception as e:
         st.error(f"Erro ao conectar no banco: {e}")
 
+def saldo_no_local(cur, id_item, id_local):
+    # Consulta direta pela chave (item, local), sem somar movimentações
+    cur.execute("SELECT quantidade FROM saldos WHERE id_item = %s AND id_local = %s", (id_item, id_local))
+    r = cur.fetchone()
+    return r[0] if r else 0
+
+def mover_saldo(cur, id_item, id_local, qtd):
+    # Soma no saldo do item naquele depósito (para baixar estoque use baixar_saldo)
+    cur.execute('''INSERT INTO saldos (id_item, id_local, quantidade) VALUES (%s, %s, %s)
+        ON CONFLICT (id_item, id_local) DO UPDATE SET quantidade = saldos.quantidade + EXCLUDED.quantidade''',
+        (id_item, id_local, qtd))
+
+def baixar_saldo(cur, id_item, id_local, qtd):
+    # Confere e baixa no mesmo comando, assim duas saídas ao mesmo tempo não deixam o saldo negativo
+    cur.execute("UPDATE saldos SET quantidade = quantidade - %s WHERE id_item = %s AND id_local = %s AND quantidade >= %s",
+                (qtd, id_item, id_local, qtd))
+    return cur.rowcount == 1
+
+def devolver_pendencias_evento(cur, id_evento):
+    # Apaga as movimentações do evento e devolve o material ao depósito de origem no mesmo passo
+    cur.execute("DELETE FROM movimentacoes WHERE id_evento = %s RETURNING id_item, id_origem, quantidade", (id_evento,))
+    for id_item, id_origem, qtd in cur.fetchall():
+        mover_saldo(cur, id_item, id_origem, qtd)
+
 # Executa a criação das tabelas
 criar_tabelas()
 
@@ -170,7 +226,13 @@ if opcao == "🏠 Início":
 elif opcao == "📦 Estoque":
     st.title("📦 Gestão de Inventário")
     
-    aba_ver, aba_cad = st.tabs(["📋 Ver Estoque Completo", "➕ Cadastrar Novo Item"])
+    con = pegar_conexao()
+    df_locais = pd.read_sql_query("SELECT id, nome FROM locais ORDER BY id", con)
+    con.close()
+    lista_locais = df_locais['id'].tolist()
+    nomes_locais = dict(zip(lista_locais, df_locais['nome'].tolist()))
+    
+    aba_ver, aba_cad, aba_transf, aba_locais = st.tabs(["📋 Ver Estoque Completo", "➕ Cadastrar Novo Item", "🔁 Transferir", "🏢 Depósitos"])
 
     with aba_cad:
         st.subheader("Adicionar Novo Material")
@@ -181,6 +243,7 @@ elif opcao == "📦 Estoque":
                 c = st.selectbox("Categoria", ["Mobiliário", "Estrutura", "Eletrônicos", "Outros"])
             with c2:
                 q = st.number_input("Quantidade Total", min_value=1, value=1)
+                dep = st.selectbox("Depósito", lista_locais, format_func=lambda x: nomes_locais[x])
                 img = st.file_uploader("Foto", type=["jpg", "png"])
             
             if st.form_submit_button("Salvar Item"):
@@ -194,7 +257,9 @@ elif opcao == "📦 Estoque":
                 
                 con = pegar_conexao()
                 cur = con.cursor()
-                cur.execute("INSERT INTO itens (nome_item, categoria, quantidade, caminho_imagem) VALUES (%s,%s,%s,%s)", (n, c, q, path))
+                cur.execute("INSERT INTO itens (nome_item, categoria, quantidade, caminho_imagem) VALUES (%s,%s,%s,%s) RETURNING id", (n, c, q, path))
+                novo_id = cur.fetchone()[0]
+                mover_saldo(cur, novo_id, dep, q)
                 con.commit()
                 cur.close()
                 con.close()
@@ -232,34 +297,61 @@ elif opcao == "📦 Estoque":
                                     nn = st.text_input("Nome", value=row['nome_item'])
                                     nc = st.selectbox("Categoria", ["Mobiliário", "Estrutura", "Eletrônicos", "Outros"], index=0)
                                     nq = st.number_input("Quantidade", value=row['quantidade'])
+                                    nd = st.selectbox("Depósito do ajuste de quantidade", lista_locais, format_func=lambda x: nomes_locais[x], key=f"dep_edit_{row['id']}")
                                     
                                     if st.form_submit_button("Salvar Alterações"):
+                                        diferenca = int(nq - row['quantidade'])
                                         con = pegar_conexao()
                                         cur = con.cursor()
-                                        cur.execute("UPDATE itens SET nome_item=%s, categoria=%s, quantidade=%s WHERE id=%s", (nn, nc, nq, row['id']))
-                                        con.commit()
+                                        
+                                        if diferenca < 0 and not baixar_saldo(cur, int(row['id']), nd, -diferenca):
+                                            st.error(f"🚫 {nomes_locais[nd]} só tem {saldo_no_local(cur, int(row['id']), nd)} unidades para baixar.")
+                                        else:
+                                            if diferenca > 0:
+                                                mover_saldo(cur, int(row['id']), nd, diferenca)
+                                            # O total anda junto com o saldo: soma a diferença em vez de gravar o valor da tela
+                                            cur.execute("UPDATE itens SET nome_item=%s, categoria=%s, quantidade=quantidade + %s WHERE id=%s", (nn, nc, diferenca, row['id']))
+                                            con.commit()
+                                            st.success("Atualizado!")
+                                            time.sleep(0.5)
+                                            st.rerun()
                                         cur.close()
                                         con.close()
-                                        st.success("Atualizado!")
-                                        time.sleep(0.5)
-                                        st.rerun()
 
                             with t_onde:
                                 con = pegar_conexao()
-                                movs = pd.read_sql_query(f"SELECT * FROM movimentacoes WHERE id_item = {row['id']}", con)
+                                saldos = pd.read_sql_query(f'''
+                                    SELECT l.nome, s.quantidade FROM saldos s
+                                    JOIN locais l ON s.id_local = l.id WHERE s.id_item = {row['id']} AND s.quantidade > 0 ORDER BY l.nome
+                                ''', con)
+                                movs = pd.read_sql_query(f'''
+                                    SELECT e.endereco, m.quantidade FROM movimentacoes m
+                                    JOIN eventos e ON m.id_evento = e.id WHERE m.id_item = {row['id']}
+                                ''', con)
                                 con.close()
 
+                                qtd_depositos = saldos['quantidade'].sum() if not saldos.empty else 0
                                 qtd_fora = movs['quantidade'].sum() if not movs.empty else 0
-                                qtd_sede = row['quantidade'] - qtd_fora
                                 
-                                st.write(f"🏠 **Na Sede:** {qtd_sede}")
+                                st.write(f"🏢 **Nos Depósitos:** {qtd_depositos}")
                                 st.write(f"🚚 **Em Eventos:** {qtd_fora}")
                                 
+                                if qtd_depositos + qtd_fora != row['quantidade']:
+                                    st.warning(f"⚠️ Depósitos + eventos somam {qtd_depositos + qtd_fora}, mas o total cadastrado é {row['quantidade']}.")
+                                
                                 if row['quantidade'] > 0:
-                                    st.progress(max(0.0, min(1.0, qtd_sede / row['quantidade'])))
+                                    st.progress(max(0.0, min(1.0, qtd_depositos / row['quantidade'])))
                                 
+                                if not saldos.empty:
+                                    st.dataframe(saldos, hide_index=True, column_config={
+                                        "nome": st.column_config.TextColumn("🏢 Depósito"),
+                                        "quantidade": st.column_config.NumberColumn("🔢 Qtd", format="%d")
+                                    })
                                 if not movs.empty:
-                                    st.dataframe(movs[['destino', 'quantidade']], hide_index=True)
+                                    st.dataframe(movs, hide_index=True, column_config={
+                                        "endereco": st.column_config.TextColumn("📍 Evento"),
+                                        "quantidade": st.column_config.NumberColumn("🔢 Qtd", format="%d")
+                                    })
 
                             with t_del:
                                 st.warning("Atenção: Exclusão permanente.")
@@ -269,6 +361,8 @@ elif opcao == "📦 Estoque":
                                     con = pegar_conexao()
                                     cur = con.cursor()
                                     cur.execute("DELETE FROM movimentacoes WHERE id_item = %s", (row['id'],))
+                                    cur.execute("DELETE FROM saldos WHERE id_item = %s", (row['id'],))
+                                    cur.execute("DELETE FROM transferencias WHERE id_item = %s", (row['id'],))
                                     cur.execute("DELETE FROM itens WHERE id = %s", (row['id'],))
                                     con.commit()
                                     cur.close()
@@ -278,6 +372,99 @@ elif opcao == "📦 Estoque":
                                     st.rerun()
                 st.markdown("---")
 
+    with aba_transf:
+        st.subheader("🔁 Transferência entre Depósitos")
+        
+        con = pegar_conexao()
+        its = pd.read_sql_query("SELECT id, nome_item FROM itens", con)
+        historico = pd.read_sql_query('''
+            SELECT t.data_transferencia, i.nome_item, o.nome as origem, d.nome as destino, t.quantidade
+            FROM transferencias t
+            JOIN itens i ON t.id_item = i.id
+            JOIN locais o ON t.id_origem = o.id
+            JOIN locais d ON t.id_destino = d.id
+            ORDER BY t.id DESC LIMIT 10
+        ''', con)
+        con.close()
+        
+        if its.empty:
+            st.warning("⚠️ Não há itens cadastrados.")
+        elif len(lista_locais) < 2:
+            st.info("Cadastre pelo menos dois depósitos na aba '🏢 Depósitos'.")
+        else:
+            col_tr1, col_tr2, col_tr3, col_tr4 = st.columns(4)
+            
+            id_item_tr = col_tr1.selectbox("Qual Item?", its['id'].tolist(), format_func=lambda x: its[its['id']==x]['nome_item'].values[0], key="item_transf")
+            orig_tr = col_tr2.selectbox("De:", lista_locais, format_func=lambda x: nomes_locais[x], key="orig_transf")
+            dest_tr = col_tr3.selectbox("Para:", lista_locais, index=1, format_func=lambda x: nomes_locais[x], key="dest_transf")
+            qtd_tr = col_tr4.number_input("Quantidade", min_value=1, value=1, key="qtd_transf")
+            
+            if st.button("Transferir 🔁", type="primary"):
+                if orig_tr == dest_tr:
+                    st.warning("Origem e destino são o mesmo depósito.")
+                else:
+                    con = pegar_conexao()
+                    cur = con.cursor()
+                    
+                    if not baixar_saldo(cur, id_item_tr, orig_tr, qtd_tr):
+                        st.error(f"🚫 PROIBIDO: Estoque insuficiente!")
+                        st.write(f"Você tentou transferir **{qtd_tr}**, mas {nomes_locais[orig_tr]} só tem **{saldo_no_local(cur, id_item_tr, orig_tr)}**.")
+                    else:
+                        mover_saldo(cur, id_item_tr, dest_tr, qtd_tr)
+                        cur.execute("INSERT INTO transferencias (id_item, id_origem, id_destino, quantidade, data_transferencia) VALUES (%s, %s, %s, %s, %s)",
+                                    (id_item_tr, orig_tr, dest_tr, qtd_tr, str(datetime.today().date())))
+                        con.commit()
+                        st.success(f"✅ Transferência registrada!")
+                        time.sleep(1)
+                        st.rerun()
+                    cur.close()
+                    con.close()
+        
+        if not historico.empty:
+            st.markdown("##### 📋 Últimas Transferências")
+            st.dataframe(historico, hide_index=True, use_container_width=True)
+
+    with aba_locais:
+        st.subheader("🏢 Depósitos")
+        
+        con = pegar_conexao()
+        df_totais = pd.read_sql_query('''
+            SELECT l.nome, COALESCE(SUM(s.quantidade), 0) as quantidade
+            FROM locais l LEFT JOIN saldos s ON s.id_local = l.id
+            GROUP BY l.id, l.nome ORDER BY l.id
+        ''', con)
+        con.close()
+        
+        st.dataframe(
+            df_totais,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "nome": st.column_config.TextColumn("🏢 Depósito", width="medium"),
+                "quantidade": st.column_config.NumberColumn("📦 Itens Guardados", format="%d", width="small")
+            }
+        )
+        
+        with st.form("form_add_local"):
+            nome_local = st.text_input("Nome do Depósito (ex: Galpão Taubaté)").strip()
+            if st.form_submit_button("Cadastrar Depósito"):
+                if not nome_local:
+                    st.warning("Preencha o nome.")
+                else:
+                    con = pegar_conexao()
+                    cur = con.cursor()
+                    cur.execute("INSERT INTO locais (nome) VALUES (%s) ON CONFLICT (nome) DO NOTHING", (nome_local,))
+                    criado = cur.rowcount == 1
+                    con.commit()
+                    cur.close()
+                    con.close()
+                    if not criado:
+                        st.warning("Esse depósito já existe!")
+                    else:
+                        st.success(f"✅ {nome_local} cadastrado!")
+                        time.sleep(0.5)
+                        st.rerun()
+
 # ==================================================
 # TELA 2: GESTÃO DE EVENTOS
 # ==================================================
@@ -373,7 +560,7 @@ elif opcao == "📅 Gestão de Eventos":
                                             if st.button("🗑️ APAGAR REGISTRO", key=f"btn_del_fin_{row['id']}", disabled=not check_del_fin):
                                                 con = pegar_conexao()
                                                 cur = con.cursor()
-                                                cur.execute("DELETE FROM movimentacoes WHERE id_evento=%s", (row['id'],))
+                                                devolver_pendencias_evento(cur, int(row['id']))
                                                 cur.execute("DELETE FROM album_fotos WHERE id_evento=%s", (row['id'],))
                                                 cur.execute("DELETE FROM eventos WHERE id=%s", (row['id'],))
                                                 con.commit()
@@ -449,7 +636,7 @@ elif opcao == "📅 Gestão de Eventos":
                                     if st.button("🗑️ Excluir Evento", key=f"del_{row['id']}", disabled=not chk_ex):
                                         con = pegar_conexao()
                                         cur = con.cursor()
-                                        cur.execute("DELETE FROM movimentacoes WHERE id_evento=%s", (row['id'],))
+                                        devolver_pendencias_evento(cur, int(row['id']))
                                         cur.execute("DELETE FROM album_fotos WHERE id_evento=%s", (row['id'],))
                                         cur.execute("DELETE FROM eventos WHERE id=%s", (row['id'],))
                                         con.commit()
@@ -565,6 +752,7 @@ elif opcao == "📅 Gestão de Eventos":
         con = pegar_conexao()
         ev_a = pd.read_sql_query("SELECT id, endereco FROM eventos WHERE status != 'Finalizado'", con)
         its = pd.read_sql_query("SELECT * FROM itens", con)
+        locs = pd.read_sql_query("SELECT id, nome FROM locais ORDER BY id", con)
         con.close()
         
         if ev_a.empty:
@@ -572,34 +760,27 @@ elif opcao == "📅 Gestão de Eventos":
         elif its.empty:
             st.warning("⚠️ Não há itens cadastrados.")
         else:
-            col_out1, col_out2, col_out3 = st.columns(3)
+            col_out1, col_out2, col_out3, col_out4 = st.columns(4)
             
             ev_sel = col_out1.selectbox("Para qual Evento?", ev_a['id'].tolist(), format_func=lambda x: ev_a[ev_a['id']==x]['endereco'].values[0])
-            id_item_sel = col_out2.selectbox("Qual Item?", its['id'].tolist(), format_func=lambda x: its[its['id']==x]['nome_item'].values[0])
-            qtd_saida = col_out3.number_input("Quantidade", min_value=1, value=1)
+            orig_sel = col_out2.selectbox("De qual Depósito?", locs['id'].tolist(), format_func=lambda x: locs[locs['id']==x]['nome'].values[0])
+            id_item_sel = col_out3.selectbox("Qual Item?", its['id'].tolist(), format_func=lambda x: its[its['id']==x]['nome_item'].values[0])
+            qtd_saida = col_out4.number_input("Quantidade", min_value=1, value=1)
             
             if st.button("Registrar Saída 🚚", type="primary"):
                 con = pegar_conexao()
+                cur = con.cursor()
                 
-                query_uso = f"SELECT SUM(quantidade) FROM movimentacoes WHERE id_item = {id_item_sel}"
-                df_uso = pd.read_sql_query(query_uso, con)
-                qtd_usada = df_uso.iloc[0,0]
-                if qtd_usada is None: qtd_usada = 0
-                
-                qtd_total_item = its[its['id'] == id_item_sel]['quantidade'].values[0]
-                qtd_disponivel = qtd_total_item - qtd_usada
-                
-                if qtd_saida > qtd_disponivel:
+                if not baixar_saldo(cur, id_item_sel, orig_sel, qtd_saida):
                     st.error(f"🚫 PROIBIDO: Estoque insuficiente!")
-                    st.write(f"Você tentou enviar **{qtd_saida}**, mas só tem **{qtd_disponivel}** disponíveis.")
+                    st.write(f"Você tentou enviar **{qtd_saida}**, mas só tem **{saldo_no_local(cur, id_item_sel, orig_sel)}** disponíveis nesse depósito.")
                 else:
-                    cur = con.cursor()
-                    cur.execute("INSERT INTO movimentacoes (id_evento, id_item, quantidade, destino) VALUES (%s, %s, %s, %s)", (ev_sel, id_item_sel, qtd_saida, "Evento"))
+                    cur.execute("INSERT INTO movimentacoes (id_evento, id_item, quantidade, destino, id_origem) VALUES (%s, %s, %s, %s, %s)", (ev_sel, id_item_sel, qtd_saida, "Evento", orig_sel))
                     con.commit()
-                    cur.close()
                     st.success(f"✅ Sucesso! Saída registrada.")
                     time.sleep(1)
                     st.rerun()
+                cur.close()
                 con.close()
 
     # --- ABA RETORNO (VISUAL MELHORADO) ---
@@ -609,11 +790,12 @@ elif opcao == "📅 Gestão de Eventos":
 
         con = pegar_conexao()
         movs = pd.read_sql_query('''
-            SELECT m.id, e.endereco, i.nome_item, m.quantidade 
+            SELECT m.id, m.id_item, m.id_origem, e.endereco, i.nome_item, m.quantidade 
             FROM movimentacoes m
             JOIN eventos e ON m.id_evento = e.id
             JOIN itens i ON m.id_item = i.id
         ''', con)
+        locs = pd.read_sql_query("SELECT id, nome FROM locais ORDER BY id", con)
         con.close()
         
         if movs.empty:
@@ -628,6 +810,8 @@ elif opcao == "📅 Gestão de Eventos":
                     use_container_width=True,
                     column_config={
                         "id": None,
+                        "id_item": None,
+                        "id_origem": None,
                         "endereco": st.column_config.TextColumn("📍 Evento / Local", width="large"),
                         "nome_item": st.column_config.TextColumn("📦 Material", width="medium"),
                         "quantidade": st.column_config.NumberColumn("🔢 Qtd Pendente", format="%d", width="small")
@@ -635,36 +819,52 @@ elif opcao == "📅 Gestão de Eventos":
                 )
 
             st.divider()
-            col_dev1, col_dev2, col_dev3 = st.columns([3, 2, 2])
+            col_dev1, col_dev2, col_dev3, col_dev4 = st.columns([3, 2, 2, 2])
             
             with col_dev1:
                 lista_opcoes = movs.apply(lambda x: f"{x['id']} - {x['nome_item']} (No local: {x['quantidade']}) em {x['endereco']}", axis=1).tolist()
                 selecao = st.selectbox("Selecione a Movimentação:", lista_opcoes)
             
             id_mov_selecionado = int(selecao.split(" - ")[0])
-            qtd_maxima_no_local = int(movs[movs['id'] == id_mov_selecionado]['quantidade'].values[0])
+            mov_sel = movs[movs['id'] == id_mov_selecionado].iloc[0]
+            qtd_maxima_no_local = int(mov_sel['quantidade'])
+            lista_locs = locs['id'].tolist()
 
             with col_dev2:
                 qtd_devolver = st.number_input("Qtd a Devolver", min_value=1, max_value=qtd_maxima_no_local, value=qtd_maxima_no_local)
 
             with col_dev3:
+                # Por padrão o material volta para o depósito de onde saiu
+                idx_orig = lista_locs.index(mov_sel['id_origem']) if mov_sel['id_origem'] in lista_locs else 0
+                dep_retorno = st.selectbox("Volta para:", lista_locs, index=idx_orig, format_func=lambda x: locs[locs['id']==x]['nome'].values[0])
+
+            with col_dev4:
                 st.write("") 
                 st.write("") 
                 if st.button("Confirmar Retorno 📥", type="primary"):
                     con = pegar_conexao()
                     cur = con.cursor()
                     
-                    if qtd_devolver == qtd_maxima_no_local:
-                        cur.execute("DELETE FROM movimentacoes WHERE id = %s", (id_mov_selecionado,))
-                        msg = "✅ Devolução total! Item baixado."
-                    else:
-                        nova_qtd = qtd_maxima_no_local - qtd_devolver
-                        cur.execute("UPDATE movimentacoes SET quantidade = %s WHERE id = %s", (nova_qtd, id_mov_selecionado))
-                        msg = f"✅ Devolução parcial! {qtd_devolver} retornaram."
+                    # Baixa na movimentação só se ela ainda tiver essa quantidade (evita devolver duas vezes)
+                    cur.execute("UPDATE movimentacoes SET quantidade = quantidade - %s WHERE id = %s AND quantidade >= %s",
+                                (qtd_devolver, id_mov_selecionado, qtd_devolver))
                     
-                    con.commit()
-                    cur.close()
-                    con.close()
-                    st.success(msg)
-                    time.sleep(1.5)
-                    st.rerun()
+                    if cur.rowcount != 1:
+                        cur.close()
+                        con.close()
+                        st.error("🚫 Essa movimentação já foi devolvida ou alterada. Atualize a página.")
+                    else:
+                        mover_saldo(cur, int(mov_sel['id_item']), dep_retorno, qtd_devolver)
+                        cur.execute("DELETE FROM movimentacoes WHERE id = %s AND quantidade = 0", (id_mov_selecionado,))
+                        
+                        if cur.rowcount == 1:
+                            msg = "✅ Devolução total! Item baixado."
+                        else:
+                            msg = f"✅ Devolução parcial! {qtd_devolver} retornaram."
+                        
+                        con.commit()
+                        cur.close()
+                        con.close()
+                        st.success(msg)
+                        time.sleep(1.5)
+                        st.rerun()